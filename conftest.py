@@ -0,0 +1,21 @@
+import subprocess
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_subprocess(request, monkeypatch):
+    """
+    Guarantees the unit tests never fork a real process: any call that
+    slips past the run_command mocks raises loudly instead of spawning.
+    Integration tests that genuinely need real hardware tools opt out
+    with @pytest.mark.real_subprocess.
+    """
+    if request.node.get_closest_marker("real_subprocess"):
+        return
+
+    def _blocked(*args, **kwargs):
+        raise RuntimeError(f"unmocked subprocess call: {args[0] if args else kwargs}")
+
+    monkeypatch.setattr(subprocess, "run", _blocked)
+    monkeypatch.setattr(subprocess, "Popen", _blocked)
@@ -28,6 +28,7 @@ SYS-TEST-RIG-AMD:
       - "113-D5121100-102"
 """
 
+@pytest.mark.real_subprocess
 @pytest.mark.skipif(not shutil.which("nvidia-smi"), reason="nvidia-smi not found, skipping NVIDIA integration test")
 def test_integration_nvidia_on_real_hardware(tmp_path, monkeypatch):
     """
@@ -44,7 +45,8 @@ def test_integration_nvidia_on_real_hardware(tmp_path, monkeypatch):
 
     original_run_command = validate_gpu.run_command
     def mock_run_command_for_integration(command):
-        if "dmidecode -s system-product-name" in command:
+        cmd_str = " ".join(command) if isinstance(command, list) else command
+        if "dmidecode -s system-product-name" in cmd_str:
             return "SYS-TEST-RIG-NVIDIA"
         return original_run_command(command)
 
@@ -58,6 +60,7 @@ def test_integration_nvidia_on_real_hardware(tmp_path, monkeypatch):
     # to match the INTEGRATION_CONFIG_CONTENT_NVIDIA above.
     assert e.value.code == 0
 
+@pytest.mark.real_subprocess
 @pytest.mark.skipif(not shutil.which("rocm-smi"), reason="rocm-smi not found, skipping AMD integration test")
 def test_integration_amd_on_real_hardware(tmp_path, monkeypatch):
     """
@@ -74,7 +77,8 @@ def test_integration_amd_on_real_hardware(tmp_path, monkeypatch):
 
     original_run_command = validate_gpu.run_command
     def mock_run_command_for_integration(command):
-        if "dmidecode -s system-product-name" in command:
+        cmd_str = " ".join(command) if isinstance(command, list) else command
+        if "dmidecode -s system-product-name" in cmd_str:
             return "SYS-TEST-RIG-AMD"
         return original_run_command(command)
 
@@ -1,7 +1,6 @@
 import pytest
 import shutil
 import validate_gpu # Import the main script we are testing
-import importlib
 
 # -----------------------------------------------------------------------------
 # Pytest Fixture: 'monkeypatch'
@@ -13,14 +12,19 @@ import importlib
 # -----------------------------------------------------------------------------
 
 @pytest.fixture(autouse=True)
-def clean_module(monkeypatch):
+def clean_module():
     """
-    This fixture automatically runs for every test. It reloads the 
-    `validate_gpu` module to ensure that the global `report_data` dictionary
-    is reset to its initial state before each test run. This prevents
-    state from leaking between tests.
+    This fixture automatically runs for every test. It resets the global
+    `report_data` dictionary in place so state can't leak between tests,
+    which is much cheaper than reloading the whole module (re-importing
+    PyYAML, recompiling regexes, rebuilding the class hierarchy).
     """
-    importlib.reload(validate_gpu)
+    validate_gpu.reset_report()
+    # The PATH probe is cached; clear it so each test's mocked
+    # shutil.which is actually consulted. The config parse cache is
+    # deliberately left warm: the session-scoped golden.yml never
+    # changes, so successive tests skip the parse entirely.
+    validate_gpu._which_cached.cache_clear()
 
 @pytest.fixture
 def mock_tools(monkeypatch):
@@ -31,25 +35,33 @@ def mock_tools(monkeypatch):
     # Create a mock 'run_command' function
     def mock_run_command(command):
         # This acts as a router: returns different fake data based on the command
+        # (run_command takes argv lists now, so join for substring matching)
+        command = " ".join(command) if isinstance(command, list) else command
         if "dmidecode -s system-product-name" in command:
             # Pretend we are this NVIDIA server
             return "SYS-421GU-TNXR"
         
-        if "nvidia-smi -L" in command:
+        # If a command isn't handled by our mock, log it
+        validate_gpu.log_msg(f"[MOCK] Unhandled command: {command}", is_error=True)
+        return ""
+
+    # Create a mock 'run_command_lines' for the streaming GPU probes
+    def mock_run_command_lines(command):
+        command = " ".join(command) if isinstance(command, list) else command
+        if "nvidia-smi --query-gpu=name" in command:
             # Pretend we have one H100 GPU
-            return "GPU 0: NVIDIA H100 80GB PCIe (UUID: ...)"
-        
-        if "nvidia-smi -q | grep 'VBIOS Version'" in command:
+            return ["NVIDIA H100 80GB PCIe"]
+
+        if "nvidia-smi --query-gpu=vbios_version" in command:
             # Pretend our VBIOS is the *correct* version
-            return "    VBIOS Version                       : 96.00.41.00.01"
-        
+            return ["96.00.41.00.01"]
+
         # Simulate an AMD server (for the BOM mismatch test)
         if "rocm-smi --showproductname" in command:
-            return "Card #0: AMD Instinct MI300X"
+            return ["Card #0: AMD Instinct MI300X"]
 
-        # If a command isn't handled by our mock, log it
         validate_gpu.log_msg(f"[MOCK] Unhandled command: {command}", is_error=True)
-        return ""
+        return []
 
     # Create a mock 'which' function
     def mock_which(tool_name):
@@ -61,18 +73,13 @@ def mock_tools(monkeypatch):
     # Apply the patches!
     # 1. Replace the real 'validate_gpu.run_command' with our mock function
     monkeypatch.setattr(validate_gpu, "run_command", mock_run_command)
-    # 2. Replace the real 'shutil.which' with our mock function
+    # 2. Same for the streaming variant used by the validators
+    monkeypatch.setattr(validate_gpu, "run_command_lines", mock_run_command_lines)
+    # 3. Replace the real 'shutil.which' with our mock function
     monkeypatch.setattr(shutil, "which", mock_which)
 
-@pytest.fixture
-def setup_config_files(tmp_path, monkeypatch):
-    """
-    A fixture to create a fake golden.yml and mock the file paths
-    that the main script will use.
-    """
-    
-    # 1. Define the fake golden.yml content
-    config_content = """
+# The fake golden.yml content shared by every test
+GOLDEN_CONFIG_CONTENT = """
 SYS-421GU-TNXR:
   expected_gpu_vendor: "nvidia"
   gpu_spec:
@@ -89,15 +96,26 @@ SYS-8125GS-TNHR:
       - "123.456.789.001"
       - "123.456.789.000"
     """
-    # 2. Create the file in the temporary directory
-    config_file = tmp_path / "golden.yml"
-    config_file.write_text(config_content)
 
-    # 3. Define a path for the temporary JSON report
-    report_file = tmp_path / "report.json"
+@pytest.fixture(scope="session")
+def _config_file(tmp_path_factory):
+    """
+    Writes the fake golden.yml once for the whole test session. The file
+    never changes between tests, so there's no need to re-create (and
+    re-parse) it per test.
+    """
+    config_file = tmp_path_factory.mktemp("cfg") / "golden.yml"
+    config_file.write_text(GOLDEN_CONFIG_CONTENT)
+    return config_file
 
-    # 4. Patch the main script to use these *temporary* file paths
-    monkeypatch.setattr(validate_gpu, "CONFIG_FILE_PATH", str(config_file))
+@pytest.fixture
+def setup_config_files(_config_file, tmp_path, monkeypatch):
+    """
+    Points the main script at the session-scoped golden.yml and a
+    per-test JSON report path. Only the monkeypatching is per-test.
+    """
+    report_file = tmp_path / "report.json"
+    monkeypatch.setattr(validate_gpu, "CONFIG_FILE_PATH", str(_config_file))
     monkeypatch.setattr(validate_gpu, "JSON_REPORT_PATH", str(report_file))
 
 
@@ -161,20 +179,26 @@ def test_happy_path_amd_pass(monkeypatch, setup_config_files):
 
     # 2. Mock 'run_command' to return AMD-specific values
     def mock_run_command_amd(command):
+        command = " ".join(command) if isinstance(command, list) else command
         if "dmidecode -s system-product-name" in command:
             return "SYS-8125GS-TNHR" # <-- This is the key for the YAML
-        
+
+        return "" # Ignore other commands
+
+    def mock_run_command_lines_amd(command):
+        command = " ".join(command) if isinstance(command, list) else command
         if "rocm-smi --showproductname" in command:
             # Return the correct model from the YAML
-            return "Card #0: AMD Instinct MI300X"
-        
+            return ["Card #0: AMD Instinct MI300X"]
+
         if "rocm-smi --showvbios" in command:
             # Return a VBIOS that is in the YAML's list
-            return "Card #0: VBIOS version: 123.456.789.001"
-        
-        return "" # Ignore other commands
-    
+            return ["Card #0: VBIOS version: 123.456.789.001"]
+
+        return [] # Ignore other commands
+
     monkeypatch.setattr(validate_gpu, "run_command", mock_run_command_amd)
+    monkeypatch.setattr(validate_gpu, "run_command_lines", mock_run_command_lines_amd)
 
     # We expect main() to call sys.exit(0)
     with pytest.raises(SystemExit) as e:
@@ -204,14 +228,21 @@ def test_fail_path_nvidia_wrong_vbios(monkeypatch, setup_config_files):
 
     # 2. Mock 'run_command' to return the wrong VBIOS
     def mock_run_command_wrong_vbios(command):
+        command = " ".join(command) if isinstance(command, list) else command
         if "dmidecode -s system-product-name" in command:
             return "SYS-421GU-TNXR"
-        if "nvidia-smi -L" in command:
-            return "GPU 0: NVIDIA H100 80GB PCIe (UUID: ...)"
-        if "nvidia-smi -q | grep 'VBIOS Version'" in command:
-            return "    VBIOS Version                       : 99.99.99.99.99"
         return ""
+
+    def mock_run_command_lines_wrong_vbios(command):
+        command = " ".join(command) if isinstance(command, list) else command
+        if "nvidia-smi --query-gpu=name" in command:
+            return ["NVIDIA H100 80GB PCIe"]
+        if "nvidia-smi --query-gpu=vbios_version" in command:
+            return ["99.99.99.99.99"]
+        return []
+
     monkeypatch.setattr(validate_gpu, "run_command", mock_run_command_wrong_vbios)
+    monkeypatch.setattr(validate_gpu, "run_command_lines", mock_run_command_lines_wrong_vbios)
 
     # We expect main() to call sys.exit(1)
     with pytest.raises(SystemExit) as e:
@@ -267,7 +298,9 @@ def test_fail_path_config_not_found(monkeypatch):
 
     # Patch CONFIG_FILE_PATH to a non-existent path
     monkeypatch.setattr(validate_gpu, "CONFIG_FILE_PATH", "/tmp/non_existent_file.yml")
-    # (We don't need to mock commands; it should fail before that)
+    # Mock the system model lookup so we get past Phase 1 without
+    # spawning anything; the config load is what should fail.
+    monkeypatch.setattr(validate_gpu, "run_command", lambda command: "SYS-421GU-TNXR")
 
     with pytest.raises(SystemExit) as e:
         validate_gpu.main()
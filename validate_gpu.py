@@ -9,30 +9,83 @@ and outputs a structured JSON report.
 
 import subprocess
 import sys
+import os
 import re
+import shlex
 import shutil
 import json
 import datetime
-from abc import ABC, abstractmethod
+import tempfile
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
 try:
     import yaml
 except ImportError:
     print("[FAIL] PyYAML library not found. Please run: pip install pyyaml")
     sys.exit(1)
 
+# Optional C-accelerated JSON serializer; stdlib json's indent path is
+# pure Python and several times slower on large reports.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed C loader; the pure-Python fallback is an
+# order of magnitude slower at parsing the golden config.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    print("[INFO] PyYAML C extension (libyaml) not available; using the slower pure-Python loader.")
+
 # --- Configuration ---
 CONFIG_FILE_PATH = "./golden_config.yml"
 JSON_REPORT_PATH = "./validation_report.json" # Machine-readable output
 
+# Precompiled output parsers, so the hot validation loop skips the
+# re-module cache lookup on every line. (The nvidia-smi --query-gpu
+# output needs no parsing at all.)
+_AMD_MODEL_RE = re.compile(r'Card #\d+:\s+(.*)')
+_AMD_VBIOS_RE = re.compile(r'VBIOS version:\s+(.*)')
+
+# Map of vendor names to their corresponding command-line tool
+VENDOR_TOOLS = {
+    "nvidia": "nvidia-smi",
+    "amd": "rocm-smi",
+    "intel": "level-zero-ctl"
+}
+
+# Vendors with a working validator. Anything else in VENDOR_TOOLS is
+# recognized but skipped before any subprocess is spawned.
+_SUPPORTED_VENDORS = frozenset({"nvidia", "amd"})
+
 # --- Global Report Dictionary ---
 # We will build this dictionary as the script runs
-report_data = {
-    "report_id": f"validation_report_{datetime.datetime.now().isoformat()}",
+
+# Immutable skeleton shared by every reset; the mutable checks list and
+# the timestamped report_id are filled in by reset_report.
+_BASE_REPORT = {
+    "report_id": None,
     "status": "FAIL", # Will be set to PASS at the end if failures == 0
     "system_model": "Unknown",
-    "checks_performed": []
 }
 
+def reset_report():
+    """
+    Resets the global report in place: clear + update is cheaper than
+    rebuilding (or deep-copying) the dict, and keeps every existing
+    reference to report_data valid. The report_id is stamped here, so it
+    reflects validation time rather than import time.
+    """
+    report_data.clear()
+    report_data.update(_BASE_REPORT)
+    report_data["checks_performed"] = []
+    report_data["report_id"] = f"validation_report_{datetime.datetime.now().isoformat(timespec='seconds')}"
+
+report_data = {**_BASE_REPORT, "checks_performed": []}
+
 # --- Standalone Helper Functions ---
 
 def log_msg(message, is_error=False):
@@ -44,44 +97,164 @@ def add_check_to_report(component, status, expected, actual, notes=""):
     """
     Adds a structured result to our global report_data dictionary.
     This is the core of the JSON reporting.
+
+    Checks are stored as lightweight tuples and only expanded into dicts
+    once, at serialization time in write_report, to avoid a per-check
+    dict allocation on large multi-GPU systems.
     """
-    report_data["checks_performed"].append({
-        "component": component,
-        "status": status,
-        "expected": expected,
-        "actual": actual,
-        "notes": notes
-    })
+    report_data["checks_performed"].append((component, status, expected, actual, notes))
 
 def run_command(command):
     """
-    Runs a shell command and returns its stdout.
+    Runs a command and returns its stdout.
+    Takes an argv list (preferred, avoids forking an intermediate shell)
+    or a plain string, which is split with shlex.
     Handles command failures and not found errors.
     """
+    argv = shlex.split(command) if isinstance(command, str) else command
     try:
         result = subprocess.run(
-            command, 
-            shell=True, 
-            check=True, 
-            stdout=subprocess.PIPE, 
+            argv,
+            check=True,
+            stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
-        log_msg(f"Command failed: '{command}'", is_error=True)
+        log_msg(f"Command failed: '{' '.join(argv)}'", is_error=True)
         log_msg(f"Stderr: {e.stderr.strip()}", is_error=True)
         return None
     except FileNotFoundError:
-        log_msg(f"Command '{command.split()[0]}' not found. Is it installed and in PATH?", is_error=True)
+        log_msg(f"Command '{argv[0]}' not found. Is it installed and in PATH?", is_error=True)
         return None
 
-# --- Abstract Base Class (The "Interface") ---
+def run_command_lines(command):
+    """
+    Runs a command and yields its stdout line by line.
+
+    Unlike run_command, this streams the output instead of buffering the
+    whole thing into one string and splitting it, so peak memory stays
+    at one line for chatty tools. Takes an argv list like run_command.
+    Yields nothing if the command is missing; raises
+    subprocess.CalledProcessError after streaming if it exited non-zero,
+    so callers can discard partial output.
+    """
+    argv = shlex.split(command) if isinstance(command, str) else command
+    try:
+        proc = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+    except FileNotFoundError:
+        log_msg(f"Command '{argv[0]}' not found. Is it installed and in PATH?", is_error=True)
+        return
+
+    # Drain stderr on a side thread: a child that writes more than the
+    # pipe buffer to stderr while we're still reading stdout would block
+    # forever waiting for us, and we'd block waiting for stdout EOF.
+    stderr_chunks = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()))
+    stderr_reader.start()
+    try:
+        for line in proc.stdout:
+            yield line.rstrip()
+    finally:
+        proc.stdout.close()
+        stderr_reader.join()
+        proc.wait()
+
+    if proc.returncode != 0:
+        stderr = stderr_chunks[0] if stderr_chunks else ""
+        log_msg(f"Command failed: '{' '.join(argv)}'", is_error=True)
+        log_msg(f"Stderr: {stderr.strip()}", is_error=True)
+        raise subprocess.CalledProcessError(proc.returncode, argv, stderr=stderr)
+
+def _collect_probe_lines(argv):
+    """
+    Collects the non-blank streamed lines of a probe command, or []
+    when the command fails — partial stdout from a failed tool must not
+    be validated as per-GPU values.
+    """
+    try:
+        return [line for line in run_command_lines(argv) if line.strip()]
+    except subprocess.CalledProcessError:
+        return []
+
+@functools.lru_cache(maxsize=None)
+def _which_cached(tool_name):
+    """
+    shutil.which with a cache, so repeat lookups of the same tool don't
+    re-walk $PATH doing stat() calls per directory.
+    """
+    return shutil.which(tool_name)
+
+def _make_check(pattern, predicate, check_name, expected_repr):
+    """
+    Builds a specialized check function bound to a compiled pattern, a
+    match predicate, and the expected value's report representation.
+
+    Binding these once up front removes the is_vbios branch and the
+    expected-value attribute lookups from the per-GPU loop; the model
+    check gets an equality lambda and the VBIOS check
+    frozenset.__contains__ as its predicate. A pattern of None means
+    each line already is the value.
+    """
+    def check(validator, items):
+        if not items:
+            log_msg(f"  [FAIL] Command returned no items for {check_name}.", is_error=True)
+            validator.failures += 1
+            return
+
+        if pattern is None:
+            # Output is already one bare value per line (e.g. from
+            # nvidia-smi --query-gpu); no parsing needed.
+            values = [(i, line.strip()) for i, line in enumerate(items)]
+        else:
+            matches = pattern.findall('\n'.join(items))
+            if len(matches) == len(items):
+                values = list(enumerate(v.strip() for v in matches))
+            else:
+                # Rare: some line didn't parse. Re-scan per line so the
+                # report can name the offender, and check the rest.
+                values = []
+                for i, line in enumerate(items):
+                    match = pattern.search(line)
+                    if match:
+                        values.append((i, match.group(1).strip()))
+                    else:
+                        log_msg(f"  [FAIL] Could not parse {check_name} string for GPU {i}: {line}", is_error=True)
+                        add_check_to_report(f"GPU_{i}_{check_name}", "FAIL", expected_repr, "Parse Error", line)
+                        validator.failures += 1
+
+        for i, current_value in values:
+            if predicate(current_value):
+                log_msg(f"  [PASS] GPU {i} {check_name}: {current_value}")
+                add_check_to_report(f"GPU_{i}_{check_name}", "PASS", expected_repr, current_value)
+            else:
+                log_msg(f"  [FAIL] GPU {i} {check_name} Mismatch. Expected: '{expected_repr}', Found: '{current_value}'", is_error=True)
+                add_check_to_report(f"GPU_{i}_{check_name}", "FAIL", expected_repr, current_value)
+                validator.failures += 1
+    return check
+
+# --- Base Class (The "Interface") ---
+
+class GpuValidator:
+    """Base class for GPU validators; vendor subclasses override the hooks."""
+
+    # Compiled parsers for the vendor tool's output; None means the
+    # output is already one bare value per line.
+    MODEL_PATTERN = None
+    VBIOS_PATTERN = None
 
-class GpuValidator(ABC):
-    """Abstract Base Class for GPU validators."""
     def __init__(self, gpu_spec):
         self.spec = gpu_spec
+        # Frozen set for O(1) membership checks; the YAML list is O(n)
+        # per GPU, which goes quadratic on big multi-GPU systems.
+        self._vbios_set = frozenset(gpu_spec.get('expected_vbios_list', []))
         self.failures = 0
         self.vendor_name = "Unknown" # Should be overridden by child
 
@@ -101,49 +274,45 @@ class GpuValidator(ABC):
             self.failures += 1
             return False
 
+        # Specialize the check loops for this run: the regex, predicate
+        # and expected value are bound once instead of branched on per GPU.
+        # Not expected_model.__eq__: a non-str spec value (e.g. an
+        # unquoted numeric model in YAML) would return the truthy
+        # NotImplemented for every comparison and pass everything.
+        self._check_fn_model = _make_check(
+            self.MODEL_PATTERN, lambda v: v == expected_model, "Model", expected_model)
+        self._check_fn_vbios = _make_check(
+            self.VBIOS_PATTERN, self._vbios_set.__contains__, "VBIOS", sorted(self._vbios_set))
+
         # --- Model and VBIOS Checks ---
-        self._check_models(expected_model)
-        self._check_vbios(expected_vbios_list)
+        # The two probe commands are independent, so fetch them
+        # concurrently (the subprocess IO releases the GIL). The checks
+        # themselves stay serial so the report ordering is stable.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            models_future = executor.submit(self._fetch_models)
+            vbios_future = executor.submit(self._fetch_vbios)
+            models_output = models_future.result()
+            vbios_output = vbios_future.result()
+
+        self._check_models(models_output)
+        self._check_vbios(vbios_output)
 
         log_msg(f"--- {self.vendor_name} GPU Validation Finished ---")
         return self.failures == 0
 
-    def _validate_list_of_items(self, items, check_name, expected_value, parser_regex, is_vbios=False):
-        """Generic helper to validate a list of strings against an expected value."""
-        if not items:
-            log_msg(f"  [FAIL] Command returned no items for {check_name}.", is_error=True)
-            self.failures += 1
-            return
+    def _fetch_models(self):
+        """Runs the vendor tool and returns its raw model output (IO-bound)."""
+        raise NotImplementedError
 
-        for i, line in enumerate(items):
-            match = re.search(parser_regex, line)
-            if match:
-                current_value = match.group(1).strip()
-                is_match = False
-                if is_vbios:
-                    is_match = current_value in expected_value
-                else:
-                    is_match = current_value == expected_value
-
-                if is_match:
-                    log_msg(f"  [PASS] GPU {i} {check_name}: {current_value}")
-                    add_check_to_report(f"GPU_{i}_{check_name}", "PASS", expected_value, current_value)
-                else:
-                    log_msg(f"  [FAIL] GPU {i} {check_name} Mismatch. Expected: '{expected_value}', Found: '{current_value}'", is_error=True)
-                    add_check_to_report(f"GPU_{i}_{check_name}", "FAIL", expected_value, current_value)
-                    self.failures += 1
-            else:
-                log_msg(f"  [FAIL] Could not parse {check_name} string for GPU {i}: {line}", is_error=True)
-                add_check_to_report(f"GPU_{i}_{check_name}", "FAIL", expected_value, "Parse Error", line)
-                self.failures += 1
+    def _fetch_vbios(self):
+        """Runs the vendor tool and returns its raw VBIOS output (IO-bound)."""
+        raise NotImplementedError
 
-    @abstractmethod
-    def _check_models(self, expected_model):
-        pass
+    def _check_models(self, models_output):
+        raise NotImplementedError
 
-    @abstractmethod
-    def _check_vbios(self, expected_vbios_list):
-        pass
+    def _check_vbios(self, vbios_output):
+        raise NotImplementedError
 
 # --- Concrete Validator Classes ---
 
@@ -153,80 +322,65 @@ class NvidiaValidator(GpuValidator):
         super().__init__(gpu_spec)
         self.vendor_name = "NVIDIA"
 
-    def _check_models(self, expected_model):
+    def _fetch_models(self):
+        return _collect_probe_lines(["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"])
+
+    def _fetch_vbios(self):
+        return _collect_probe_lines(["nvidia-smi", "--query-gpu=vbios_version", "--format=csv,noheader"])
+
+    def _check_models(self, models_output):
         log_msg("Checking GPU Models...")
-        models_output = run_command("nvidia-smi -L")
-        if models_output is None: self.failures += 1; return
-        self._validate_list_of_items(
-            models_output.split('\n'), 
-            "Model", 
-            expected_model, 
-            r'GPU \d+: (.*?) \(UUID:'
-        )
+        self._check_fn_model(self, models_output)
 
-    def _check_vbios(self, expected_vbios_list):
+    def _check_vbios(self, vbios_output):
         log_msg("Checking GPU VBIOS Versions...")
-        vbios_output = run_command("nvidia-smi -q | grep 'VBIOS Version'")
-        if vbios_output is None: self.failures += 1; return
-        self._validate_list_of_items(
-            vbios_output.split('\n'), 
-            "VBIOS", 
-            expected_vbios_list, 
-            r':\s+(.*)', 
-            is_vbios=True
-        )
+        self._check_fn_vbios(self, vbios_output)
 
 class AmdValidator(GpuValidator):
     """
     Concrete validation class for AMD GPUs using 'rocm-smi'.
     All AMD-specific logic is encapsulated here.
     """
+
+    MODEL_PATTERN = _AMD_MODEL_RE
+    VBIOS_PATTERN = _AMD_VBIOS_RE
+
     def __init__(self, gpu_spec):
         super().__init__(gpu_spec)
         self.vendor_name = "AMD"
         self.gpu_count = 0
 
-    def _check_models(self, expected_model):
+    def _fetch_models(self):
+        return _collect_probe_lines(["rocm-smi", "--showproductname"])
+
+    def _fetch_vbios(self):
+        return _collect_probe_lines(["rocm-smi", "--showvbios"])
+
+    def _check_models(self, models_output):
         log_msg("Checking GPU Models...")
-        models_output = run_command("rocm-smi --showproductname")
-        if models_output is None: 
+        if not models_output:
             add_check_to_report("ROCM_SMI_MODEL", "FAIL", "Command to run", "Command failed")
             self.failures += 1
             return
-        
-        gpu_models = [line for line in models_output.split('\n') if line.strip()]
-        self.gpu_count = len(gpu_models)
+
+        self.gpu_count = len(models_output)
         log_msg(f"Found {self.gpu_count} AMD GPU(s).")
 
-        self._validate_list_of_items(
-            gpu_models, 
-            "Model", 
-            expected_model, 
-            r'Card #\d+:\s+(.*)'
-        )
+        self._check_fn_model(self, models_output)
 
-    def _check_vbios(self, expected_vbios_list):
+    def _check_vbios(self, vbios_output):
         log_msg("Checking GPU VBIOS Versions...")
-        vbios_output = run_command("rocm-smi --showvbios")
-        if vbios_output is None: 
+        if not vbios_output:
             add_check_to_report("ROCM_SMI_VBIOS", "FAIL", "Command to run", "Command failed")
             self.failures += 1
             return
-        
-        vbios_versions = [line for line in vbios_output.split('\n') if line.strip()]
-        
-        if len(vbios_versions) != self.gpu_count:
-            log_msg(f"  [FAIL] VBIOS count ({len(vbios_versions)}) does not match GPU count ({self.gpu_count}).", is_error=True)
+
+        if len(vbios_output) != self.gpu_count:
+            log_msg(f"  [FAIL] VBIOS count ({len(vbios_output)}) does not match GPU count ({self.gpu_count}).", is_error=True)
             self.failures += 1
             return
 
-        self._validate_list_of_items(
-            vbios_versions, 
-            "VBIOS", 
-            expected_vbios_list, 
-            r'VBIOS version:\s+(.*)', 
-            is_vbios=True
-        )
+        self._check_fn_vbios(self, vbios_output)
 
 class IntelValidator(GpuValidator):
     """Placeholder class for Intel GPU validation."""
@@ -234,33 +388,43 @@ class IntelValidator(GpuValidator):
         super().__init__(gpu_spec)
         self.vendor_name = "Intel"
 
-    def _check_models(self, expected_model):
+    def _fetch_models(self):
+        return []
+
+    def _fetch_vbios(self):
+        return []
+
+    def _check_models(self, models_output):
         log_msg("[INFO] Intel Validator (_check_models) is not implemented in this demo.")
         add_check_to_report("Intel_Check", "SKIP", "N/A", "N/A", "Not Implemented")
 
-    def _check_vbios(self, expected_vbios_list):
+    def _check_vbios(self, vbios_output):
         log_msg("[INFO] Intel Validator (_check_vbios) is not implemented in this demo.")
 
-# --- Factory Function ---
+# --- Validator Registry ---
+
+_VALIDATORS = {
+    "nvidia": NvidiaValidator,
+    "amd": AmdValidator,
+    "intel": IntelValidator,
+}
 
 def get_validator(expected_vendor, gpu_spec):
-    """Factory function to return the correct validator instance."""
-    if expected_vendor == 'nvidia':
-        return NvidiaValidator(gpu_spec)
-    elif expected_vendor == 'amd':
-        return AmdValidator(gpu_spec)
-    elif expected_vendor == 'intel':
-        return IntelValidator(gpu_spec)
-    else:
+    """Returns an instance of the validator registered for the vendor."""
+    validator_cls = _VALIDATORS.get(expected_vendor)
+    if validator_cls is None:
         log_msg(f"No validator defined for vendor: {expected_vendor}", is_error=True)
         return None
+    return validator_cls(gpu_spec)
 
 # --- Main Execution ---
 
 def get_system_model():
     """Gets the system model name."""
     log_msg("--- [Phase 1: BOM Validation] ---")
-    current_model = run_command("dmidecode -s system-product-name | tr -d ' '")
+    current_model = run_command(["dmidecode", "-s", "system-product-name"])
+    if current_model:
+        current_model = current_model.replace(" ", "")
     if not current_model:
         log_msg("Cannot read system model name (dmidecode failed or returned empty).", is_error=True)
         log_msg("--> Did you forget to run with 'sudo'?", is_error=True)
@@ -270,11 +434,62 @@ def get_system_model():
     report_data["system_model"] = current_model
     return current_model
 
+def _write_config_cache(cache_path, config):
+    """Atomically writes the parsed config to a JSON cache sidecar."""
+    tmp_name = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            'w', dir=os.path.dirname(os.path.abspath(cache_path)),
+            suffix='.tmp', delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            json.dump(config, tmp)
+        os.replace(tmp_name, cache_path)
+    except (OSError, TypeError, ValueError):
+        # The cache is best-effort; validation works without it. Not
+        # every valid YAML value is JSON-serializable (e.g. an unquoted
+        # date parses as datetime.date), so TypeError/ValueError must
+        # not escape and fail an otherwise good config load.
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(file_path, mtime, size):
+    """
+    Parses the config at file_path, memoized per (path, mtime, size).
+
+    The first miss also consults/writes the JSON sidecar cache, so a
+    repeat call in the same process skips IO and parsing entirely while
+    a fresh process still skips the YAML parse.
+    """
+    cache_path = f"{file_path}.{mtime}-{size}.json"
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass  # Corrupt cache; fall through to the YAML parse.
+
+    with open(file_path, 'r') as f:
+        config = yaml.load(f, Loader=_SafeLoader)
+    if config is not None:
+        _write_config_cache(cache_path, config)
+    return config
+
 def load_config(file_path):
-    """Loads the YAML configuration file."""
+    """
+    Loads the YAML configuration file.
+
+    Parsing is memoized in-process and cached on disk as a JSON sidecar,
+    both keyed by the YAML's mtime and size, so only the first load of an
+    unchanged config ever pays the (much slower) YAML parse.
+    """
     try:
-        with open(file_path, 'r') as f:
-            config = yaml.safe_load(f)
+        stat = os.stat(file_path)
+        config = _load_config_cached(file_path, stat.st_mtime, stat.st_size)
         if config is None:
             log_msg(f"Golden YAML file is empty or malformed: {file_path}", is_error=True)
             add_check_to_report("YAML_Parse", "FAIL", "Valid YAML data", "File is empty or invalid")
@@ -305,22 +520,22 @@ def run_validation(current_model, config):
 
     log_msg(f"BOM requires GPU vendor: {expected_vendor}")
 
-    # Map of vendor names to their corresponding command-line tool
-    vendor_tools = {
-        "nvidia": "nvidia-smi",
-        "amd": "rocm-smi",
-        "intel": "level-zero-ctl"
-    }
-
     # Check if the expected vendor is supported
-    expected_tool = vendor_tools.get(expected_vendor)
+    expected_tool = VENDOR_TOOLS.get(expected_vendor)
     if not expected_tool:
         log_msg(f"Vendor '{expected_vendor}' is not a supported vendor in this script.", is_error=True)
         add_check_to_report("GPU_Vendor", "FAIL", expected_vendor, "Unsupported Vendor")
         return 1 # Early exit if vendor is unknown
 
+    # Known vendor without a working validator (e.g. intel): skip before
+    # spawning any subprocess or instantiating a placeholder validator.
+    if expected_vendor not in _SUPPORTED_VENDORS:
+        log_msg(f"Vendor '{expected_vendor}' validation is not implemented; skipping GPU checks.")
+        add_check_to_report("GPU_Vendor", "SKIP", expected_vendor, "Not Implemented")
+        return 0
+
     # Check if the specific tool for the expected vendor exists
-    if not shutil.which(expected_tool):
+    if not _which_cached(expected_tool):
         log_msg(f"BOM validation FAILED! Expected vendor '{expected_vendor}' but its tool ('{expected_tool}') was not found.", is_error=True)
         add_check_to_report("GPU_Vendor", "FAIL", f"Tool '{expected_tool}' to be present", "Not Found")
         failures += 1
@@ -339,6 +554,24 @@ def run_validation(current_model, config):
                 failures += validator.failures
     return failures
 
+def _dump_json(obj, path):
+    """Serializes obj to path as indented JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2, separators=(',', ': '), default=str)
+
+def _serializable_report():
+    """Expands the check tuples into dicts for JSON serialization."""
+    report = dict(report_data)
+    report["checks_performed"] = [
+        {"component": c, "status": s, "expected": e, "actual": a, "notes": n}
+        for (c, s, e, a, n) in report_data["checks_performed"]
+    ]
+    return report
+
 def write_report(failures):
     """Writes the JSON report file."""
     if failures == 0:
@@ -348,16 +581,32 @@ def write_report(failures):
         log_msg(f"{failures} failure(s) detected.")
         report_data["status"] = "FAIL"
 
+    report = _serializable_report()
+
+    # Pick the target up front so the report is serialized exactly once;
+    # the old PermissionError fallback re-serialized everything (often to
+    # the very same default path). os.fspath keeps PosixPath inputs happy.
+    target = os.fspath(JSON_REPORT_PATH)
+    target_dir = os.path.dirname(os.path.abspath(target)) or "."
+    if not os.access(target_dir, os.W_OK):
+        log_msg(f"Permission denied writing to {target}. Try running as root.", is_error=True)
+        target = "./validation_report.json"
+        log_msg(f"Falling back to {target}")
+
     try:
-        with open(JSON_REPORT_PATH, 'w') as f:
-            json.dump(report_data, f, indent=2)
-        log_msg(f"Successfully wrote JSON report to {JSON_REPORT_PATH}")
+        _dump_json(report, target)
+        log_msg(f"Successfully wrote JSON report to {target}")
     except PermissionError:
-        log_msg(f"Permission denied writing to {JSON_REPORT_PATH}. Try running as root.", is_error=True)
+        # Last resort: the directory probe passed but the file itself is
+        # unwritable (e.g. a root-owned report left by a prior sudo run,
+        # or NFS root-squash). The report dict is already built, so the
+        # retry costs one more serialization, not two.
+        log_msg(f"Permission denied writing to {target}. Try running as root.", is_error=True)
         local_report_path = "./validation_report.json"
+        if os.path.abspath(target) == os.path.abspath(local_report_path):
+            return
         try:
-            with open(local_report_path, 'w') as f:
-                json.dump(report_data, f, indent=2)
+            _dump_json(report, local_report_path)
             log_msg(f"Wrote fallback report to {local_report_path}")
         except Exception as e:
             log_msg(f"Failed to write fallback report: {e}", is_error=True)
@@ -380,6 +629,8 @@ def print_final_result(failures, system_model):
 
 def main():
     """Main function to run the validation script."""
+    reset_report()
+
     system_model = get_system_model()
     if not system_model:
         sys.exit(1)